@@ -4,12 +4,85 @@ L-curve criteria.
 Copyright (c) 2021 Nima Nooshiri (@nimanzik)
 """
 
+from functools import lru_cache
+import math
+
 import numpy as np
 from numpy import linalg as nla
+from scipy import fft as sfft
+from scipy import linalg as sla
+from scipy.sparse import issparse
 
 from peiplib.plot import nice_sci_notation
 from peiplib.util import loglinspace
 
+# Minimum number of L-curve points for which the curvature is computed
+# with the Numba kernel (if available); below it, compiling the kernel
+# costs more than it saves.
+_numba_min_points = 100000
+
+
+def _tikh_svd_precompute(U, s, d):
+    """
+    Quantities of :py:func:`tikh_svd` that do not depend on the
+    regularization parameter.
+    """
+    m, n = U.shape
+    p = s.size
+
+    if len(d.shape) == 2:
+        d = d.reshape(d.size,)
+
+    # Projection, and residual error introduced by the projection
+    d_proj = np.dot(U.T, d)
+    dr = np.dot(d, d) - np.dot(d_proj, d_proj)
+
+    # If we couldn't match the data exactly add the projection-induced misfit
+    if not ((m > n) and (dr > 0)):
+        dr = 0.0
+
+    d_proj = d_proj[:p]
+
+    # Scale series terms by singular values
+    d_proj_scale = d_proj / s
+
+    return (s * s, d_proj, d_proj_scale, dr)
+
+
+def _tikh_svd_eval(state, alphas):
+    """
+    Residual norms and solution norms of :py:func:`tikh_svd` for the
+    regularization parameters ``alphas``.
+    """
+    s2, d_proj, d_proj_scale, dr = state
+
+    # Filter factors for all regularization parameters at once;
+    # F[i, j] corresponds to s[i] and alphas[j]
+    F = np.add.outer(s2, alphas * alphas)
+    np.divide(s2[:, None], F, out=F)
+
+    E = F * d_proj_scale[:, None]
+    etas = np.sqrt(np.einsum('ij,ij->j', E, E))
+    np.subtract(1.0, F, out=F)
+    E = np.multiply(F, d_proj[:, None], out=E)
+    rhos = np.sqrt(np.einsum('ij,ij->j', E, E))
+
+    if dr:
+        rhos = np.sqrt(rhos**2 + dr)
+
+    return (rhos, etas)
+
+
+def _tikh_svd_alphas(s, npoints, alpha_min=None, alpha_max=None):
+    """
+    Regularization parameters of :py:func:`tikh_svd`.
+    """
+    smin_ratio = 16 * np.finfo(np.float64).eps
+    start = alpha_max or s[0]
+    stop = alpha_min or max(s[-1], s[0] * smin_ratio)
+    start, stop = sorted((start, stop), reverse=True)   # alpha[0] will be s[0]
+    return loglinspace(start, stop, npoints)
+
 
 def tikh_svd(U, s, d, npoints, alpha_min=None, alpha_max=None):
     """
@@ -51,42 +124,101 @@ def tikh_svd(U, s, d, npoints, alpha_min=None, alpha_max=None):
        Inverse Problems in Electrocardiology, pp 119-142.
     """
 
-    smin_ratio = 16 * np.finfo(np.float64).eps
-    start = alpha_max or s[0]
-    stop = alpha_min or max(s[-1], s[0] * smin_ratio)
-    start, stop = sorted((start, stop), reverse=True)   # alpha[0] will be s[0]
-    alphas = loglinspace(start, stop, npoints)
+    alphas = _tikh_svd_alphas(s, npoints, alpha_min, alpha_max)
+    state = _tikh_svd_precompute(U, s, d)
+    rhos, etas = _tikh_svd_eval(state, alphas)
+
+    return (rhos, etas, alphas)
 
-    m, n = U.shape
-    p = s.size
+
+def _tikh_gsvd_precompute(U, X, LAM, MU, d, G, L):
+    """
+    Quantities of :py:func:`tikh_gsvd` that do not depend on the
+    regularization parameter.
+    """
+    m, n = G.shape
 
     if len(d.shape) == 2:
         d = d.reshape(d.size,)
 
-    # Projection, and residual error introduced by the projection
-    d_proj = np.dot(U.T, d)
-    dr = nla.norm(d)**2 - nla.norm(d_proj)**2
+    lams = nla.norm(LAM, axis=0)
+    mus = nla.norm(MU, axis=0)
+    gammas = lams / mus
 
-    d_proj = d_proj[:p]
+    if m > n:
+        k = 0
+    else:
+        k = n - m
 
-    # Scale series terms by singular values
-    d_proj_scale = d_proj / s
+    # Build the solution (see Aster er al. (2011), eq. (4.49) & (4.56)).
+    # Y = inv(X).T, of which only the last n-k columns are needed. With
+    # X.T = Q @ R (for the GSVD, Q = Z.T), this is a triangular solve.
+    Q, R = sla.qr(X.T)
+    Yk = sla.solve_triangular(R, Q.T[:, k:], lower=False, check_finite=False)
+    d_proj_scale = np.dot(U[:, :n-k].T, d) / lams[k:n]
+    GY = np.dot(G, Yk)
+    LY = L @ Yk
 
-    # Initialize storage space
-    etas = np.zeros(npoints, dtype=np.float64)
-    rhos = np.zeros_like(etas)
+    g = gammas[k:]
+    zero = (lams[k:] == 0) & (mus[k:] == 0)
+    nonfinite = np.isinf(g) | np.isnan(g)
 
-    s2 = s**2
-    for i in range(npoints):
-        f = s2 / (s2 + alphas[i]**2)
-        etas[i] = nla.norm(f * d_proj_scale)
-        rhos[i] = nla.norm((1 - f) * d_proj)
+    return (gammas, g, zero, nonfinite, d_proj_scale, GY, LY, d)
 
-    # If we couldn't match the data exactly add the projection-induced misfit
-    if (m > n) and (dr > 0):
-        rhos = np.sqrt(rhos**2 + dr)
 
-    return (rhos, etas, alphas)
+def _tikh_gsvd_eval(state, alphas):
+    """
+    Residual norms and solution seminorms of :py:func:`tikh_gsvd` for
+    the regularization parameters ``alphas``.
+    """
+    _, g, zero, nonfinite, d_proj_scale, GY, LY, d = state
+
+    # Series filter coeficients for all regularization parameters;
+    # Fmat[:, ireg] holds those of alphas[ireg].
+    g2 = g * g
+    with np.errstate(invalid='ignore', divide='ignore'):
+        Fmat = g2[:, None] / (g2[:, None] + (alphas**2)[None, :])
+    Fmat[zero] = 0
+    Fmat[nonfinite] = 1
+
+    # Residuals and seminorms of all solutions; column j of Yk @ V is
+    # the model for alphas[j].
+    V = Fmat * d_proj_scale[:, None]
+    Res = GY @ V
+    Res -= d[:, None]
+    E = LY @ V
+    rhos = np.sqrt(np.einsum('ij,ij->j', Res, Res))
+    etas = np.sqrt(np.einsum('ij,ij->j', E, E))
+
+    return (rhos, etas)
+
+
+def _tikh_gsvd_alphas(state, G, L, npoints, alpha_min=None, alpha_max=None):
+    """
+    Regularization parameters of :py:func:`tikh_gsvd`.
+    """
+    m, n = G.shape
+    p = nla.matrix_rank(L.toarray() if issparse(L) else L)
+    gammas = state[0]
+
+    if alpha_min and alpha_max:
+        start = alpha_max
+        stop = alpha_min
+    else:
+        gmin_ratio = 16 * np.finfo(np.float64).eps
+        if m <= n:
+            # The under-determined or square case.
+            i1, i2 = sorted((n-m, p-1))
+            start = alpha_max or gammas[i2]
+            stop = alpha_min or max(gammas[i1], gammas[i2]*gmin_ratio)
+        else:
+            # The over-determined case.
+            start = alpha_max or gammas[p-1]
+            stop = alpha_min or max(gammas[0], gammas[p-1]*gmin_ratio)
+
+    # alpha[0] will be s[0]
+    start, stop = sorted((start, stop), reverse=True)
+    return loglinspace(start, stop, npoints)
 
 
 def tikh_gsvd(
@@ -115,8 +247,9 @@ def tikh_gsvd(
         The data vector.
     G : array-like
         The system matrix (forward operator or design matrix).
-    L : array-like
-        The roughening matrix.
+    L : array-like or :py:class:`scipy.sparse.csr.csr_matrix`
+        The roughening matrix, e.g. as returned by
+        :py:func:`peiplib.linalg.roughmat`.
     npoints : int
         Number of logarithmically spaced regularization parameters.
     alpha_min : float (optional)
@@ -139,68 +272,89 @@ def tikh_gsvd(
        Estimation and Inverse Problems`, Elsevier, pp 103-107.
     """
 
-    m, n = G.shape
-    p = nla.matrix_rank(L)
+    state = _tikh_gsvd_precompute(U, X, LAM, MU, d, G, L)
+    alphas = _tikh_gsvd_alphas(state, G, L, npoints, alpha_min, alpha_max)
+    rhos, etas = _tikh_gsvd_eval(state, alphas)
 
-    if len(d.shape) == 2:
-        d = d.reshape(d.size,)
+    return (rhos, etas, alphas)
 
-    lams = np.sqrt(np.diag(LAM.T @ LAM))
-    mus = np.sqrt(np.diag(MU.T @ MU))
-    gammas = lams / mus
 
-    if alpha_min and alpha_max:
-        start = alpha_max
-        stop = alpha_min
-    else:
-        gmin_ratio = 16 * np.finfo(np.float64).eps
-        if m <= n:
-            # The under-determined or square case.
-            i1, i2 = sorted((n-m, p-1))
-            start = alpha_max or gammas[i2]
-            stop = alpha_min or max(gammas[i1], gammas[i2]*gmin_ratio)
-        else:
-            # The over-determined case.
-            start = alpha_max or gammas[p-1]
-            stop = alpha_min or max(gammas[0], gammas[p-1]*gmin_ratio)
+def _curvature_vec(xs, ys):
+    """
+    Curvature of the L-curve points ``(xs, ys)``; NumPy implementation.
+    """
+    x1 = xs[:-2]
+    x2 = xs[1:-1]
+    x3 = xs[2:]
+    y1 = ys[:-2]
+    y2 = ys[1:-1]
+    y3 = ys[2:]
 
-    # alpha[0] will be s[0]
-    start, stop = sorted((start, stop), reverse=True)
-    alphas = loglinspace(start, stop, npoints)
+    # The side length for each triangle
+    a = np.sqrt((x1 - x2)**2 + (y1 - y2)**2)
+    b = np.sqrt((x2 - x3)**2 + (y2 - y3)**2)
+    c = np.sqrt((x3 - x1)**2 + (y3 - y1)**2)
 
-    if m > n:
-        k = 0
-    else:
-        k = n - m
+    # Semi-perimiter
+    s = (a + b + c) / 2.0
 
-    # Initialization.
-    etas = np.zeros(npoints, dtype=np.float64)
-    rhos = np.zeros_like(etas)
-
-    # Solve for each solution.
-    Y = np.transpose(nla.inv(X))
-    for ireg in range(npoints):
-
-        # Series filter coeficients for this regularization parameter.
-        f = np.zeros(n, dtype=np.float64)
-        for igam in range(k, n):
-            gam = gammas[igam]
-
-            if np.isinf(gam) or np.isnan(gam):
-                f[igam] = 1
-            elif (lams[igam] == 0) and (mus[igam] == 0):
-                f[igam] = 0
-            else:
-                f[igam] = gam**2 / (gam**2 + alphas[ireg]**2)
-
-        # Build the solution (see Aster er al. (2011), eq. (4.49) & (4.56)).
-        d_proj_scale = np.dot(U[:, :n-k].T, d) / lams[k:n]
-        F = np.diag(f)
-        mod = np.dot(Y[:, k:], np.dot(F, d_proj_scale))
-        rhos[ireg] = nla.norm(np.dot(G, mod) - d)
-        etas[ireg] = nla.norm(np.dot(L, mod))
+    # Area of triangles (Herron's formula)
+    areas = np.sqrt(s * (s - a) * (s - b) * (s - c))
 
-    return (rhos, etas, alphas)
+    # The radius of each circle
+    radii = (a * b * c) / (4.0 * areas)
+
+    # The curvature for each estimate for each value which is the
+    # reciprocal of its circumscribed radius. Since there aren't
+    # circles for the end points they have no curvature.
+    return np.hstack([0.0, 1.0 / radii, 0.0])
+
+
+@lru_cache(maxsize=None)
+def _curvature_numba():
+    """
+    Curvature kernel fused into a single parallel loop and compiled with
+    Numba, or None if Numba is not available. Numba is imported on first
+    use only.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True, error_model='numpy')
+    def curvature(xs, ys):
+        n = xs.size - 2
+        kappa = np.zeros(n + 2)
+        for i in prange(n):
+            ax = xs[i] - xs[i+1]
+            ay = ys[i] - ys[i+1]
+            bx = xs[i+1] - xs[i+2]
+            by = ys[i+1] - ys[i+2]
+            cx = xs[i+2] - xs[i]
+            cy = ys[i+2] - ys[i]
+            a = math.sqrt(ax*ax + ay*ay)
+            b = math.sqrt(bx*bx + by*by)
+            c = math.sqrt(cx*cx + cy*cy)
+            s = 0.5 * (a + b + c)
+            area = math.sqrt(s * (s - a) * (s - b) * (s - c))
+            kappa[i+1] = (4.0 * area) / (a * b * c)
+
+        return kappa
+
+    return curvature
+
+
+def _curvature(xs, ys):
+    """
+    Curvature of the L-curve points ``(xs, ys)``.
+    """
+    if xs.size >= _numba_min_points:
+        curvature = _curvature_numba()
+        if curvature is not None:
+            return curvature(xs, ys)
+
+    return _curvature_vec(xs, ys)
 
 
 def corner_maxcurv(rhos, etas, alphas):
@@ -238,31 +392,7 @@ def corner_maxcurv(rhos, etas, alphas):
     xs = np.log(rhos)
     ys = np.log(etas)
 
-    x1 = xs[:-2]
-    x2 = xs[1:-1]
-    x3 = xs[2:]
-    y1 = ys[:-2]
-    y2 = ys[1:-1]
-    y3 = ys[2:]
-
-    # The side length for each triangle
-    a = np.sqrt((x1 - x2)**2 + (y1 - y2)**2)
-    b = np.sqrt((x2 - x3)**2 + (y2 - y3)**2)
-    c = np.sqrt((x3 - x1)**2 + (y3 - y1)**2)
-
-    # Semi-perimiter
-    s = (a + b + c) / 2.0
-
-    # Area of triangles (Herron's formula)
-    areas = np.sqrt(s * (s - a) * (s - b) * (s - c))
-
-    # The radius of each circle
-    radii = (a * b * c) / (4.0 * areas)
-
-    # The curvature for each estimate for each value which is the
-    # reciprocal of its circumscribed radius. Since there aren't
-    # circles for the end points they have no curvature.
-    kappa = np.hstack([0.0, 1.0 / radii, 0.0])
+    kappa = _curvature(xs, ys)
 
     i_corner = np.nanargmax(np.abs(kappa[1:-1]))
     alpha_corner = alphas[i_corner]
@@ -272,6 +402,64 @@ def corner_maxcurv(rhos, etas, alphas):
     return (rho_corner, eta_corner, alpha_corner)
 
 
+def _mdf_fixed_point(f, alpha_init, tol, maxiter):
+    """
+    Fixed point of the MDF iteration ``alpha = f(alpha)``, accelerated by
+    Aitken's delta-squared extrapolation (Steffensen's method).
+    """
+    a0 = alpha_init
+    a1 = f(a0)
+    counter = 1
+
+    # Last plain iterate before the first accepted extrapolate. If the
+    # accelerated iterates leave the domain of ``f``, the plain iteration
+    # resumes from there without extrapolation.
+    a_rollback = None
+    extrapolate = True
+
+    while counter < maxiter:
+        if a_rollback is None:
+            a2 = f(a1)
+        else:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                a2 = f(a1)
+        counter += 1
+
+        if (a_rollback is not None) and not np.isfinite(a2):
+            a1 = a_rollback
+            a_rollback = None
+            extrapolate = False
+            continue
+
+        # Extrapolate from the last three iterates once they contract
+        # (|ratio| < 1); far from the fixed point the steps may still grow
+        # and the extrapolate is meaningless. The extrapolate is accepted
+        # only if it is closer to a fixed point than the plain iterate.
+        a_aitken = f_aitken = np.nan
+        if extrapolate and (a1 != a0) and (counter < maxiter):
+            ratio = (a2 - a1) / (a1 - a0)
+            if abs(ratio) < 1:
+                a_aitken = a2 - (a2 - a1) * ratio / (ratio - 1.0)
+                if (a_aitken > 0) and (a_aitken != a2):
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        f_aitken = f(a_aitken)
+                    counter += 1
+
+        if abs(f_aitken - a_aitken) < abs(a2 - a1):
+            if a_rollback is None:
+                a_rollback = a2
+            change = abs((a_aitken/a2) - 1.0)
+            a0, a1 = a_aitken, f_aitken
+        else:
+            change = abs((a2/a1) - 1.0)
+            a0, a1 = a1, a2
+
+        if not (change > tol):
+            break
+
+    return a1
+
+
 def corner_mdf_svd(U, s, d, alpha_init=None, tol=1.0e-16, maxiter=1200):
     """
     Determination of Tikhonov regularization parameter using L-curve criterion.
@@ -311,8 +499,11 @@ def corner_mdf_svd(U, s, d, alpha_init=None, tol=1.0e-16, maxiter=1200):
        generalized L-curve framework`, Inverse Problems, 18, 1161-1183.
     """
 
+    state = _tikh_svd_precompute(U, s, d)
+
     # Origin point O=(a,b)
-    rhos, etas, alphas = tikh_svd(U, s, d, 2)
+    alphas = _tikh_svd_alphas(s, 2)
+    rhos, etas = _tikh_svd_eval(state, alphas)
     a = np.log10(rhos[np.argmin(alphas)]**2)
     b = np.log10(etas[np.argmax(alphas)]**2)
 
@@ -321,29 +512,21 @@ def corner_mdf_svd(U, s, d, alpha_init=None, tol=1.0e-16, maxiter=1200):
         alpha_init = q[1]
 
     def f(alpha_pre):
-        rho_pre, eta_pre, _ = tikh_svd(
-            U, s, d, 1, alpha_min=alpha_pre, alpha_max=alpha_pre)
-        rho_pre = np.asscalar(rho_pre)
-        eta_pre = np.asscalar(eta_pre)
+        rhos, etas = _tikh_svd_eval(state, np.array([alpha_pre]))
+        rho_pre = float(rhos[0])
+        eta_pre = float(etas[0])
         dum1 = (rho_pre/eta_pre)**2
         dum2 = np.log10(eta_pre**2) - b
         dum3 = np.log10(rho_pre**2) - a
         alpha_next = np.sqrt(dum1 * (dum2/dum3))
         return alpha_next
 
-    alpha_next = f(alpha_init)
-    change = abs((alpha_next/alpha_init) - 1.0)
-
-    counter = 1
-    while (change > tol) and (counter < maxiter):
-        alpha_pre = alpha_next
-        alpha_next = f(alpha_pre)
-        change = abs((alpha_next/alpha_pre) - 1.0)
-        counter += 1
+    alpha_next = _mdf_fixed_point(f, alpha_init, tol, maxiter)
 
-    rho_corner, eta_corner, alpha_corner = map(
-        np.asscalar,
-        tikh_svd(U, s, d, 1, alpha_min=alpha_next, alpha_max=alpha_next))
+    alpha_corner = float(alpha_next)
+    rhos, etas = _tikh_svd_eval(state, np.array([alpha_corner]))
+    rho_corner = float(rhos[0])
+    eta_corner = float(etas[0])
 
     return (alpha_corner, rho_corner, eta_corner)
 
@@ -370,8 +553,9 @@ def corner_mdf_gsvd(
         The data vector.
     G : array-like
         The system matrix (forward operator or design matrix).
-    L : array-like
-        The roughening matrix.
+    L : array-like or :py:class:`scipy.sparse.csr.csr_matrix`
+        The roughening matrix, e.g. as returned by
+        :py:func:`peiplib.linalg.roughmat`.
     alpha_init : float (optional)
         An appropriate initial regularization parameter.
     tol : float
@@ -397,8 +581,11 @@ def corner_mdf_gsvd(
        generalized L-curve framework`, Inverse Problems, 18, 1161-1183.
     """
 
+    state = _tikh_gsvd_precompute(U, X, LAM, MU, d, G, L)
+
     # Origin point O=(a,b)
-    rhos, etas, alphas = tikh_gsvd(U, X, LAM, MU, d, G, L, 2)
+    alphas = _tikh_gsvd_alphas(state, G, L, 2)
+    rhos, etas = _tikh_gsvd_eval(state, alphas)
     a = np.log10(rhos[np.argmin(alphas)]**2)
     b = np.log10(etas[np.argmax(alphas)]**2)
 
@@ -407,33 +594,37 @@ def corner_mdf_gsvd(
         alpha_init = q[4]
 
     def f(alpha_pre):
-        rho_pre, eta_pre, _ = tikh_gsvd(
-            U, X, LAM, MU, d, G, L, 1, alpha_min=alpha_pre,
-            alpha_max=alpha_pre)
-        rho_pre = np.asscalar(rho_pre)
-        eta_pre = np.asscalar(eta_pre)
+        rhos, etas = _tikh_gsvd_eval(state, np.array([alpha_pre]))
+        rho_pre = float(rhos[0])
+        eta_pre = float(etas[0])
         dum1 = (rho_pre/eta_pre)**2
         dum2 = np.log10(eta_pre**2) - b
         dum3 = np.log10(rho_pre**2) - a
         alpha_next = np.sqrt(dum1 * (dum2/dum3))
         return alpha_next
 
-    alpha_next = f(alpha_init)
-    change = abs((alpha_next/alpha_init) - 1.0)
+    alpha_next = _mdf_fixed_point(f, alpha_init, tol, maxiter)
 
-    counter = 1
-    while (change > tol) and (counter < maxiter):
-        alpha_pre = alpha_next
-        alpha_next = f(alpha_pre)
-        change = abs((alpha_next/alpha_pre) - 1.0)
-        counter += 1
-
-    rho_corner, eta_corner, alpha_corner = map(np.asscalar, tikh_gsvd(
-        U, X, LAM, MU, d, G, L, 1, alpha_min=alpha_next, alpha_max=alpha_next))
+    alpha_corner = float(alpha_next)
+    rhos, etas = _tikh_gsvd_eval(state, np.array([alpha_corner]))
+    rho_corner = float(rhos[0])
+    eta_corner = float(etas[0])
 
     return (alpha_corner, rho_corner, eta_corner)
 
 
+def _tikh_freq_models(GHD, GHG, k2p, alphas):
+    """
+    Predicted model spectra of Tikhonov regularization in the frequency
+    domain; row ``i`` corresponds to ``alphas[i]``.
+    """
+    Denom = GHG[None, :] + (alphas**2)[:, None] * k2p[None, :]
+    Mf = np.zeros_like(Denom)
+    np.divide(GHD[None, :], Denom, out=Mf, where=(Denom != 0))
+
+    return Mf
+
+
 def lcurve_freq(
         Gspec, Dspec, deltat, order, npoints, alpha_min, alpha_max):
     """
@@ -488,33 +679,21 @@ def lcurve_freq(
     else:
         ntrans = (2*N) - 1
 
-    freqs = np.fft.rfftfreq(ntrans, d=deltat)
+    freqs = sfft.rfftfreq(ntrans, d=deltat)
 
     alpha_min, alpha_max = sorted((alpha_min, alpha_max), reverse=True)
     alphas = loglinspace(alpha_max, alpha_min, npoints)
 
     GHD = np.conj(Gspec) * Dspec
     GHG = np.conj(Gspec) * Gspec
-    k2p = np.power(2*np.pi*freqs, 2*order, dtype=np.complex)
+    k2p = np.power(2*np.pi*freqs, 2*order)
 
-    # Initialize storage spaces
-    rhos = np.zeros(npoints, dtype=np.float64)
-    etas = np.zeros(npoints, dtype=np.float64)
+    # Predicted models for all alphas; freq domain
+    Mf = _tikh_freq_models(GHD, GHG, k2p, alphas)
 
-    for i, alpha in enumerate(alphas):
-
-        # Predicted model; freq domain
-        numer = GHD
-        denom = GHG + np.full_like(GHG, alpha*alpha*k2p)
-        idx = np.where((np.abs(numer) != 0) & (np.abs(denom) != 0))
-        Mf = np.zeros_like(GHG, dtype=np.complex)
-        Mf[idx] = numer[idx] / denom[idx]
-
-        # Keep track of the residual norm for each alpha
-        rhos[i] = nla.norm(Gspec*Mf - Dspec)
-
-        # Keep track of the model norm for each alpha
-        etas[i] = nla.norm(Mf)
+    # Residual norm and model norm for each alpha
+    rhos = nla.norm(Gspec[None, :]*Mf - Dspec[None, :], axis=1)
+    etas = nla.norm(Mf, axis=1)
 
     return (rhos, etas, alphas)
 
@@ -535,14 +714,23 @@ class UpdateFrequncyModel(object):
             self.ntrans = 2 * (Gspec.size-1)
         else:
             self.ntrans = (2*Gspec.size) - 1
-        self.freqs = np.fft.rfftfreq(self.ntrans, d=self.deltat)
+        self.freqs = sfft.rfftfreq(self.ntrans, d=self.deltat)
         self.ndata = self.xdata.size
-        self.ydata = np.zeros((npoints, self.ndata), dtype=np.float64)
-        self.rhos = np.zeros(npoints, dtype=np.float64)
-        self.etas = np.zeros(npoints, dtype=np.float64)
-        self.__GHD = np.conj(Gspec) * Dspec
-        self.__GHG = np.conj(Gspec) * Gspec
-        self.__k2p = np.power(2*np.pi*self.freqs, 2*order)
+
+        # Predicted models for all alphas; freq domain
+        GHD = np.conj(Gspec) * Dspec
+        GHG = np.conj(Gspec) * Gspec
+        k2p = np.power(2*np.pi*self.freqs, 2*order)
+        Mf = _tikh_freq_models(GHD, GHG, k2p, self.alphas)
+
+        # Residual norm and model norm/seminorm for each alpha
+        self.rhos = nla.norm(Gspec[None, :]*Mf - Dspec[None, :], axis=1)
+        self.etas = nla.norm(Mf, axis=1)
+
+        # Predicted models for all alphas; time domain
+        md = sfft.irfft(Mf, axis=-1, overwrite_x=True, workers=-1)
+        self.ydata = md[:, :self.ndata]
+
         self.line, = ax.plot([], [], 'k-')
 
     def init_func(self):
@@ -552,30 +740,10 @@ class UpdateFrequncyModel(object):
 
     def __call__(self, i):
 
-        alpha = self.alphas[i]
-
-        # Predicted model; freq domain
-        numer = self.__GHD
-        denom = self.__GHG + np.full_like(self.__GHG, alpha*alpha*self.__k2p)
-        idx = np.where((np.abs(numer) != 0) & (np.abs(denom) != 0))
-        Mf = np.zeros_like(self.__GHG, dtype=np.complex)
-        Mf[idx] = numer[idx] / denom[idx]
-
-        # Predicted model; time domain
-        md = np.fft.irfft(Mf)
-
-        # Store predicted model for each alpha
-        self.ydata[i] = md[:self.ndata]
-
-        # Keep track of the residual norm for each alpha
-        self.rhos[i] = nla.norm(self.Gspec*Mf-self.Dspec)
-
-        # Keep track of the model norm/seminorm for each alpha
-        self.etas[i] = nla.norm(Mf)
-
-        # Plot the newly fit model
-        self.line.set_data(self.xdata, md[:len(self.xdata)])
-        self.ax.set_title(r'$\alpha$={}'.format(nice_sci_notation(alpha)))
+        # Plot the precomputed model
+        self.line.set_data(self.xdata, self.ydata[i])
+        self.ax.set_title(
+            r'$\alpha$={}'.format(nice_sci_notation(self.alphas[i])))
 
         return self.line,
 
@@ -4,11 +4,9 @@ Linear algebra utilities.
 Copyright (c) 2021 Nima Nooshiri (@nimanzik)
 """
 
-from itertools import count
-
 import numpy as np
 from scipy import linalg as sla
-from scipy.sparse import csr_matrix
+from scipy.sparse import csr_matrix, diags
 
 
 def roughmat(n, order, full=True):
@@ -54,23 +52,17 @@ def roughmat(n, order, full=True):
         df = np.insert(df[:order], 0, 0) - np.append(df[:order], 0)
 
     nd = n - order
+    if full:
+        return diags(df, offsets=np.arange(order + 1), shape=(nd, n)).toarray()
+
     vals = np.tile(df, nd)
-    c = count(start=0, step=(order + 1))
-    rowptrs = []
-    colinds = []
-    for i in range(nd):
-        rowptrs.append(next(c))
-        colinds.extend(range(i, i + order + 1))
+    colinds = (np.arange(nd)[:, None] + np.arange(order + 1)[None, :]).ravel()
 
     # By convension, rowptrs[end]=nnz, where nnz is
     # the number of nonzero values in L.
-    rowptrs.append(len(vals))
+    rowptrs = np.arange(nd + 1) * (order + 1)
 
-    L = csr_matrix((vals, colinds, rowptrs), shape=[nd, n])
-
-    if full:
-        return L.toarray()
-    return L
+    return csr_matrix((vals, colinds, rowptrs), shape=[nd, n])
 
 
 class MatrixColumnMismatch(Exception):
@@ -107,9 +99,9 @@ def _diagp(Y, X, k):
     """
     D = _diagk(X, k)
     j = np.where((np.real(D) < 0) | (np.imag(D) != 0))[0]
-    D = np.diag(np.conj(D[j]) / np.abs(D[j]))
-    Y[:, j] = np.dot(Y[:, j], D.T)
-    X[j, :] = np.dot(D, X[j, :])
+    scale = np.conj(D[j]) / np.abs(D[j])
+    Y[:, j] = Y[:, j] * scale
+    X[j, :] = X[j, :] * scale[:, None]
 
     return (Y, X)
 
@@ -130,33 +122,21 @@ def _csd(Q1, Q2):
     if pb != p:
         raise MatrixColumnMismatch()
 
-    if m < n:
-        V, U, Z, S, C = _csd(Q2, Q1)
-        j = np.arange(p)[-1::-1]
-        C = C[:, j]
-        S = S[:, j]
-        Z = Z[:, j]
-        m = min(m, p)
-        i = np.arange(m)[-1::-1]
-        C[:m, :] = C[i, :]
-        U[:, :m] = U[:, i]
-        n = min(n, p)
-        i = np.arange(n)[-1::-1]
-        S[:n, :] = S[i, :]
-        V[:, :n] = V[:, i]
-        return (U, V, Z, C, S)
+    # Decompose the tall orientation and swap the factors back at the end.
+    swapped = m < n
+    if swapped:
+        Q1, Q2 = Q2, Q1
+        m, n = n, m
 
     # Henceforth, (n <= m)
-    U, c, Zh = sla.svd(Q1)
+    U, c, Zh = sla.svd(Q1, check_finite=False, lapack_driver='gesdd')
     C = sla.diagsvd(c, *Q1.shape)
     Z = np.transpose(Zh)
 
     q = min(m, p)
-    i = np.arange(q)
-    j = np.arange(q)[-1::-1]
-    C[:q, :q] = C[q-1::-1, q-1::-1]
-    U[:, i] = U[:, j]
-    Z[:, i] = Z[:, j]
+    C[:q, :q] = np.flip(C[:q, :q])
+    U[:, :q] = np.flip(U[:, :q], axis=1)
+    Z[:, :q] = np.flip(Z[:, :q], axis=1)
     S = np.dot(Q2, Z)
 
     if q == 1:
@@ -173,7 +153,7 @@ def _csd(Q1, Q2):
     if k == 0:
         V = np.identity(S[:, :k].shape[0])
     else:
-        V, _ = sla.qr(S[:, :k])
+        V, _ = sla.qr(S[:, :k], check_finite=False)
 
     S = np.dot(V.T, S)
 
@@ -184,23 +164,21 @@ def _csd(Q1, Q2):
 
     if k < min(n, p):
         r = min(n, p)
-        i = np.arange(k, n)
-        j = np.arange(k, r)
-        UT, sT, VhT = sla.svd(S[k:n, k:r])
+        UT, sT, VhT = sla.svd(
+            S[k:n, k:r], check_finite=False, lapack_driver='gesdd')
         ST = sla.diagsvd(sT, n-k, r-k)
         VT = np.transpose(VhT)
         if k > 0:
             S[:k, k:r] = 0
 
         S[k:n, k:r] = ST
-        C[:, j] = np.dot(C[:, j], VT)
-        V[:, i] = np.dot(V[:, i], UT)
-        Z[:, j] = np.dot(Z[:, j], VT)
+        C[:, k:r] = np.dot(C[:, k:r], VT)
+        V[:, k:n] = np.dot(V[:, k:n], UT)
+        Z[:, k:r] = np.dot(Z[:, k:r], VT)
 
-        i = np.arange(k, q)
-        Q, R = sla.qr(C[k:q, k:r])
+        Q, R = sla.qr(C[k:q, k:r], check_finite=False)
         C[k:q, k:r] = _diagf(R)
-        U[:, i] = np.dot(U[:, i], Q)
+        U[:, k:q] = np.dot(U[:, k:q], Q)
 
     if m < p:
         # Diagonalize final block of S and permute blocks.
@@ -212,15 +190,13 @@ def _csd(Q1, Q2):
         dum1 = np.count_nonzero(np.abs(_diagk(C, 0)) > 10*m*eps)
         dum2 = np.count_nonzero(np.abs(_diagk(S, 0)) > 10*n*eps)
         q = min(dum1, dum2)
-        i = np.arange(q, n)
-        j = np.arange(m, p)
 
         # At this point, S(i,j) should have orthogonal columns and the
         # elements of S(:,q+1:p) outside of S(i,j) should be negligible.
-        Q, R = sla.qr(S[q:n, m:p])
+        Q, R = sla.qr(S[q:n, m:p], check_finite=False)
         S[:, q:p] = 0
         S[q:n, m:p] = _diagf(R)
-        V[:, i] = np.dot(V[:, i], Q)
+        V[:, q:n] = np.dot(V[:, q:n], Q)
 
         if n > 1:
             i = np.hstack([
@@ -246,6 +222,19 @@ def _csd(Q1, Q2):
     V, S = _diagp(V, S, 0)
     S = np.real(S)
 
+    if swapped:
+        U, V, C, S = V, U, S, C
+        m, n = n, m
+        C = np.flip(C, axis=1)
+        S = np.flip(S, axis=1)
+        Z = np.flip(Z, axis=1)
+        m = min(m, p)
+        C[:m, :] = np.flip(C[:m, :], axis=0)
+        U[:, :m] = np.flip(U[:, :m], axis=1)
+        n = min(n, p)
+        S[:n, :] = np.flip(S[:n, :], axis=0)
+        V[:, :n] = np.flip(V[:, :n], axis=1)
+
     return (U, V, Z, C, S)
 
 
@@ -282,7 +271,8 @@ def gsvd(A, B, full_matrices=True, compute_all=True):
             QB, B = _diagp(QB, B, 0)
             n = p
 
-    Q, R = sla.qr(np.vstack([A, B]), mode='economic')
+    # The stacked matrix is a fresh copy, so it may be overwritten.
+    Q, R = sla.qr(np.vstack([A, B]), mode='economic', overwrite_a=True)
     U, V, Z, C, S = _csd(Q[0:m, :], Q[m:m+n, :])
 
     if compute_all:
@@ -101,13 +101,12 @@ def solve_tikh_fd(Gspec, Dspec, deltat, order, alpha):
         ntrans = (2*N) - 1
 
     freqs = np.fft.rfftfreq(ntrans, d=deltat)
-    k2p = np.power(2*np.pi*freqs, 2*order, dtype=np.complex)
+    k2p = np.power(2*np.pi*freqs, 2*order)
 
     numer = np.conj(Gspec) * Dspec
     denom = np.conj(Gspec) * Gspec + np.full_like(numer, alpha*alpha*k2p)
-    idx = np.where((np.abs(numer) != 0) & (np.abs(denom) != 0))
-    Mf = np.zeros_like(numer, dtype=np.complex)
-    Mf[idx] = numer[idx] / denom[idx]
+    Mf = np.zeros_like(numer, dtype=np.complex128)
+    np.divide(numer, denom, out=Mf, where=(denom != 0))
     return Mf
 
 
@@ -0,0 +1,89 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from peiplib.lcurve import (
+    _curvature_numba, _curvature_vec, _mdf_fixed_point, corner_mdf_svd,
+    tikh_svd)
+from peiplib.util import loglinspace
+
+
+def plain_mdf_svd(U, s, d, tol=1.0e-16, maxiter=1200):
+    """Unaccelerated MDF fixed-point iteration."""
+    rhos, etas, alphas = tikh_svd(U, s, d, 2)
+    a = np.log10(rhos[np.argmin(alphas)]**2)
+    b = np.log10(etas[np.argmax(alphas)]**2)
+
+    def f(alpha):
+        rho, eta, _ = tikh_svd(U, s, d, 1, alpha_min=alpha, alpha_max=alpha)
+        rho, eta = rho[0], eta[0]
+        return np.sqrt(
+            (rho/eta)**2 * (np.log10(eta**2) - b) / (np.log10(rho**2) - a))
+
+    alpha_pre = loglinspace(alphas[0], alphas[1], 3)[1]
+    for _ in range(maxiter):
+        alpha_next = f(alpha_pre)
+        if abs((alpha_next/alpha_pre) - 1.0) <= tol:
+            break
+        alpha_pre = alpha_next
+
+    return alpha_next
+
+
+# (shape of G, seed) of problems on which the plain iteration converges
+# but an Aitken extrapolate, or the plain step following it, falls where
+# the MDF update is undefined (NaN).
+mdf_svd_cases = [
+    ((25, 20), 3),
+    ((27, 13), 17),
+    ((27, 13), 18),
+    ((27, 13), 202),
+    ((15, 8), 101),
+    ((15, 8), 284)]
+
+
+@pytest.mark.parametrize('shape, seed', mdf_svd_cases)
+def test_corner_mdf_svd_matches_plain_iteration(shape, seed):
+    rng = np.random.default_rng(seed)
+    G = rng.standard_normal(shape)
+    d = rng.standard_normal(shape[0])
+    U, s, _ = np.linalg.svd(G)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        alpha_plain = plain_mdf_svd(U, s, d)
+        alpha_corner, rho_corner, eta_corner = corner_mdf_svd(U, s, d)
+
+    assert np.isfinite([alpha_corner, rho_corner, eta_corner]).all()
+    assert np.isclose(alpha_corner, alpha_plain, rtol=1e-8)
+
+
+@pytest.mark.parametrize('maxiter', range(1, 12))
+def test_mdf_fixed_point_respects_maxiter(maxiter):
+    ncalls = [0]
+
+    def f(alpha):
+        ncalls[0] += 1
+        return 1.0 + 0.5*np.sin(3.0*alpha)
+
+    _mdf_fixed_point(f, 0.1, 1.0e-16, maxiter)
+    assert ncalls[0] <= maxiter
+
+
+@pytest.mark.skipif(
+    _curvature_numba() is None, reason='Numba is not available')
+def test_curvature_numba_matches_numpy():
+    rng = np.random.default_rng(0)
+    xs = np.cumsum(rng.random(50))
+    ys = -np.sqrt(np.cumsum(rng.random(50)))
+
+    # A repeated point gives degenerate triangles (NaN curvature).
+    xs[20] = xs[21]
+    ys[20] = ys[21]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        kappa = _curvature_vec(xs, ys)
+
+    assert np.isnan(kappa).any()
+    np.testing.assert_allclose(_curvature_numba()(xs, ys), kappa)